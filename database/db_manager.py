@@ -15,6 +15,8 @@ except ImportError:
     import hmac
 from datetime import datetime
 from pathlib import Path
+import functools
+import threading
 
 import sys
 IS_WASM = sys.platform == "emscripten"
@@ -25,6 +27,37 @@ if IS_WASM:
 else:
     DB_PATH = Path(__file__).parent / "cortex.db"
 
+# Per-case reads (case row, evidence, custody log) are cached until the next write.
+# Every write bumps the generation, so a read that raced a write is never stored.
+_read_cache = {}
+_read_cache_generation = 0
+_read_cache_lock = threading.Lock()
+
+def _cached_read(func):
+    """Cache a per-case getter's result until the next write through this module"""
+    @functools.wraps(func)
+    def wrapper(case_id):
+        key = (func.__name__, case_id)
+        with _read_cache_lock:
+            if key in _read_cache:
+                return _read_cache[key]
+            generation = _read_cache_generation
+        
+        result = func(case_id)
+        
+        with _read_cache_lock:
+            if generation == _read_cache_generation:
+                _read_cache[key] = result
+        return result
+    return wrapper
+
+def _invalidate_reads():
+    """Drop cached reads after a write"""
+    global _read_cache_generation
+    with _read_cache_lock:
+        _read_cache_generation += 1
+        _read_cache.clear()
+
 def init_database():
     """Initialize the CORTEX database with required tables"""
     conn = sqlite3.connect(DB_PATH)
@@ -196,6 +229,7 @@ def create_case(case_id, case_name, investigator, device_info="", notes=""):
         
         conn.commit()
         conn.close()
+        _invalidate_reads()
         
         add_chain_of_custody(case_id, "Case Created", investigator, f"Created case: {case_name}")
         
@@ -218,6 +252,7 @@ def get_all_cases():
     
     return cases
 
+@_cached_read
 def get_case(case_id):
     """Get a specific case by ID"""
     conn = sqlite3.connect(DB_PATH)
@@ -239,6 +274,7 @@ def update_case(case_id, **kwargs):
     
     conn.commit()
     conn.close()
+    _invalidate_reads()
 
 def delete_case(case_id):
     """Delete a case and all associated evidence"""
@@ -251,6 +287,7 @@ def delete_case(case_id):
     
     conn.commit()
     conn.close()
+    _invalidate_reads()
 
 def add_evidence(case_id, artifact_type, artifact_name, file_path="", hash_value="", metadata=None):
     """Add evidence to a case"""
@@ -265,7 +302,9 @@ def add_evidence(case_id, artifact_type, artifact_name, file_path="", hash_value
     
     conn.commit()
     conn.close()
+    _invalidate_reads()
 
+@_cached_read
 def get_case_evidence(case_id):
     """Get all evidence for a case"""
     conn = sqlite3.connect(DB_PATH)
@@ -289,13 +328,19 @@ def add_chain_of_custody(case_id, action, performed_by, details=""):
     
     conn.commit()
     conn.close()
+    _invalidate_reads()
 
+@_cached_read
 def get_chain_of_custody(case_id):
     """Get chain of custody log for a case"""
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
     
-    cursor.execute("SELECT * FROM chain_of_custody WHERE case_id = ? ORDER BY timestamp ASC", (case_id,))
+    # The last column is the timestamp preformatted for display (YYYY-MM-DD HH:MM)
+    cursor.execute("""
+        SELECT *, strftime('%Y-%m-%d %H:%M', timestamp) FROM chain_of_custody
+        WHERE case_id = ? ORDER BY timestamp ASC
+    """, (case_id,))
     logs = cursor.fetchall()
     conn.close()
     
@@ -53,9 +53,6 @@ def render_timeline_reconstruction():
     if 'timeline' in st.session_state:
         timeline = st.session_state['timeline']
         
-        # Convert timestamps to datetime objects to avoid TypeError with floats
-        timeline['Timestamp'] = pd.to_datetime(timeline['Timestamp'], errors='coerce')
-        
         min_ts = timeline['Timestamp'].min()
         max_ts = timeline['Timestamp'].max()
         
@@ -189,7 +186,10 @@ def build_timeline():
             })
     
     if timeline_events:
-        return pd.DataFrame(timeline_events).sort_values('Timestamp', ascending=False)
+        timeline = pd.DataFrame(timeline_events)
+        # Parse once here so reruns and charts don't convert the column again
+        timeline['Timestamp'] = pd.to_datetime(timeline['Timestamp'], errors='coerce')
+        return timeline.sort_values('Timestamp', ascending=False)
     else:
         return pd.DataFrame(columns=['Timestamp', 'Type', 'Description', 'Source'])
 
@@ -1,8 +1,14 @@
 import streamlit as st
 import os
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import math
+import numpy as np
 import pandas as pd
-from datetime import datetime
+import pyarrow as pa
+import pyarrow.compute as pc
+from dateutil import tz
 
 # Try to import pytsk3, handle if missing
 try:
@@ -11,6 +17,191 @@ try:
 except ImportError:
     HAS_PYTSK3 = False
 
+# Leading region of an image primed into the page cache before TSK opens it
+# (partition tables and filesystem superblocks live here)
+PRIME_BYTES = 16 << 20
+
+# Block size per read when extracting a file from the image
+EXTRACT_BLOCK = 4 * 1024 * 1024
+
+# Reciprocal of 1024**3, so size display is a multiply rather than a divide
+BYTES_TO_GB = 1.0 / (1 << 30)
+
+# Demo partition layout and key directories, built once at import.
+# Widget keys and table views are precomputed here so reruns don't rebuild them.
+_DEMO_PARTITIONS = [
+    {"name": "boot", "type": "ext4", "size": "32 MB", "files": 150},
+    {"name": "system", "type": "ext4", "size": "2.8 GB", "files": 4521},
+    {"name": "userdata", "type": "ext4", "size": "12.5 GB", "files": 8934},
+    {"name": "cache", "type": "ext4", "size": "512 MB", "files": 342},
+]
+
+# Table views of the demo data, rendered as one dataframe widget each
+_DEMO_PARTITIONS_DF = pd.DataFrame(_DEMO_PARTITIONS).rename(columns={
+    "name": "Partition", "type": "Type", "size": "Size", "files": "Files"
+})
+
+_KEY_DIRS = {
+    "userdata": [
+        {
+            "path": "/data/data/com.whatsapp/databases",
+            "description": "WhatsApp chat databases",
+            "file_count": 45,
+            "value": "High"
+        },
+        {
+            "path": "/data/data/com.android.providers.contacts/databases",
+            "description": "Contacts database",
+            "file_count": 12,
+            "value": "High"
+        },
+        {
+            "path": "/data/data/com.android.providers.telephony/databases",
+            "description": "SMS and call logs",
+            "file_count": 8,
+            "value": "Critical"
+        },
+        {
+            "path": "/data/media/DCIM",
+            "description": "Camera photos and videos",
+            "file_count": 532,
+            "value": "Medium"
+        },
+        {
+            "path": "/data/data/com.android.chrome/app_chrome/Default",
+            "description": "Chrome browser history and cache",
+            "file_count": 234,
+            "value": "Medium"
+        },
+        {
+            "path": "/data/system/users/0",
+            "description": "User account information",
+            "file_count": 23,
+            "value": "High"
+        }
+    ],
+    "system": [
+        {
+            "path": "/system/build.prop",
+            "description": "System build properties",
+            "file_count": 1,
+            "value": "Low"
+        }
+    ],
+}
+for _dirs in _KEY_DIRS.values():
+    for _directory in _dirs:
+        _directory["extract_key"] = f"extract_{_directory['path']}"
+
+_KEY_DIRS_DF = {
+    partition: pd.DataFrame(dirs).rename(columns={
+        "path": "Path", "description": "Description", "file_count": "Files", "value": "Forensic Value"
+    }).drop(columns="extract_key")
+    for partition, dirs in _KEY_DIRS.items()
+}
+
+def prime_image_cache(image_path):
+    """Ask the kernel to read ahead the image head; TSK's own block cache is tiny"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(image_path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, PRIME_BYTES, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, PRIME_BYTES, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+def scan_partitions(img_info):
+    """Return the allocated partitions of an opened image"""
+    volume_info = pytsk3.Volume_Info(img_info)
+    parts = list(volume_info)
+    
+    # Filter allocated slots with one vectorized AND over the flags column
+    flags = np.fromiter((p.flags for p in parts), dtype=np.uint32, count=len(parts))
+    allocated = np.flatnonzero(flags & pytsk3.TSK_VS_PART_FLAG_ALLOC)
+    
+    partitions = []
+    for i in allocated:
+        p = parts[i]
+        partitions.append({
+            "Address": p.addr,
+            "Start": p.start,
+            "Length": p.len,
+            "Description": p.desc.decode('utf-8'),
+            "Offset_Bytes": p.start * 512
+        })
+    return partitions
+
+def image_state(image_path):
+    """(path, size, mtime_ns) of an image; changes whenever the file is re-acquired in place"""
+    stat = os.stat(image_path)
+    return image_path, stat.st_size, stat.st_mtime_ns
+
+# Background warm-up results: image_state -> (size_bytes, partitions),
+# or None while the prefetch is still running / if it failed
+_PREFETCH = {}
+_PREFETCH_LOCK = threading.Lock()
+
+def _warm_tsk(state):
+    """Read the image's size and partition table ahead of the user's scan"""
+    image_path = state[0]
+    try:
+        prime_image_cache(image_path)
+        img_info = pytsk3.Img_Info(image_path)
+        result = (img_info.get_size(), scan_partitions(img_info))
+    except Exception:
+        return
+    with _PREFETCH_LOCK:
+        if state in _PREFETCH:
+            _PREFETCH[state] = result
+
+def prefetch_image(image_path):
+    """Start warming the image's partition table in the background, once per image state"""
+    try:
+        state = image_state(image_path)
+    except OSError:
+        return
+    with _PREFETCH_LOCK:
+        if state in _PREFETCH:
+            return
+        # Results for an earlier version of this file will never be asked for again
+        for stale in [key for key in _PREFETCH if key[0] == image_path]:
+            del _PREFETCH[stale]
+        _PREFETCH[state] = None
+    threading.Thread(target=_warm_tsk, args=(state,), daemon=True).start()
+
+def take_prefetched(image_path):
+    """Remove and return the warmed (size_bytes, partitions) for the image as it is now, if ready"""
+    try:
+        state = image_state(image_path)
+    except OSError:
+        return None
+    with _PREFETCH_LOCK:
+        return _PREFETCH.pop(state, None)
+
+# Largest partition count whose filesystems are opened ahead of browsing;
+# also the size of the open-filesystem cache so warmed handles aren't evicted
+PREWARM_MAX_PARTITIONS = 16
+
+@functools.lru_cache(maxsize=PREWARM_MAX_PARTITIONS)
+def open_filesystem(image_path, offset, mtime_ns):
+    """
+    Open the filesystem at `offset` once per browsing session and reuse it for
+    listings and extractions. Returns (img_info, fs_info); img_info is kept
+    alongside because FS_Info only borrows it. Keyed on the image's mtime_ns
+    like _read_directory, so an image re-acquired in place gets a fresh handle.
+    """
+    img_info = pytsk3.Img_Info(image_path)
+    try:
+        fs_info = pytsk3.FS_Info(img_info, offset=offset)
+    except Exception:
+        # If offset points to start of image or valid but not FS, try opening without offset or detect
+        fs_info = pytsk3.FS_Info(img_info)
+    return img_info, fs_info
+
 def get_file_type(entry):
     """Get human readable file type"""
     if not entry.info.meta:
@@ -23,72 +214,171 @@ def get_file_type(entry):
     else:
         return "OTHER"
 
-def list_directory_contents(image_path, offset, path="/"):
-    """List contents of a directory using pytsk3"""
-    results = []
-    try:
-        img_info = pytsk3.Img_Info(image_path)
+@st.cache_data(ttl=300, max_entries=512, show_spinner=False)
+def _read_directory(image_path, offset, path, mtime_ns):
+    """Read a directory listing; cached per image state (mtime_ns) so reruns skip pytsk3"""
+    _, fs_info = open_filesystem(image_path, offset, mtime_ns)
+    directory = fs_info.open_dir(path)
+    
+    # Collect one list per column; the DataFrame is built from typed arrays
+    names, types, sizes, inodes, crtimes = [], [], [], [], []
+    for entry in directory:
         try:
-            fs_info = pytsk3.FS_Info(img_info, offset=offset)
+            if entry.info.name.name in [b".", b".."]:
+                continue
+            
+            meta = entry.info.meta
+            names.append(entry.info.name.name.decode('utf-8', 'replace'))
+            types.append(get_file_type(entry))
+            sizes.append(meta.size if meta else 0)
+            inodes.append(meta.addr if meta else 0)
+            # Raw creation time if available; formatted for the whole column below
+            crtimes.append(meta.crtime if meta and meta.crtime else np.nan)
         except Exception:
-            # If offset points to start of image or valid but not FS, try opening without offset or detect
-             fs_info = pytsk3.FS_Info(img_info)
+            continue
+    
+    created = pd.to_datetime(np.asarray(crtimes, dtype=np.float64), unit='s', utc=True, errors='coerce')
+    created = created.tz_convert(tz.tzlocal()).strftime('%Y-%m-%d %H:%M:%S')
+    
+    return pd.DataFrame({
+        "Name": names,
+        "Type": types,
+        "Size": np.asarray(sizes, dtype=np.int64),
+        "Inode": np.asarray(inodes, dtype=np.int64),
+        "Created": pd.Index(created).fillna(""),
+    })
 
-        directory = fs_info.open_dir(path)
-        
-        for entry in directory:
-            try:
-                if entry.info.name.name in [b".", b".."]:
-                    continue
-                
-                name = entry.info.name.name.decode('utf-8', 'replace')
-                file_type = get_file_type(entry)
-                size = entry.info.meta.size if entry.info.meta else 0
-                inode = entry.info.meta.addr if entry.info.meta else 0
-                
-                # Get timestamps if available
-                created = ""
-                if entry.info.meta and entry.info.meta.crtime:
-                    try:
-                        created = datetime.fromtimestamp(entry.info.meta.crtime).strftime('%Y-%m-%d %H:%M:%S')
-                    except: pass
-                
-                results.append({
-                    "Name": name,
-                    "Type": file_type,
-                    "Size": size,
-                    "Inode": inode,
-                    "Created": created
-                })
-            except Exception:
-                continue
-                
+# Background pool that warms listings of subdirectories the user may open next
+_LISTING_PREFETCH = ThreadPoolExecutor(max_workers=4)
+PREFETCH_MAX_SUBDIRS = 50
+
+# Listings already queued, as (image_path, offset, path, mtime_ns), so reruns
+# don't resubmit them; each subdirectory is queued once per image state
+_QUEUED_LISTINGS = set()
+_QUEUED_LISTINGS_LOCK = threading.Lock()
+
+def _prefetch_listing(image_path, offset, path, mtime_ns):
+    """Populate the listing cache for one directory; failures are left for the real click"""
+    try:
+        _read_directory(image_path, offset, path, mtime_ns)
+    except Exception:
+        pass
+
+def prefetch_subdirectories(image_path, offset, current_path, df_files):
+    """Queue background listings of the direct subdirectories of current_path"""
+    subdirs = df_files.loc[df_files['Type'] == 'DIR', 'Name']
+    if subdirs.empty or len(subdirs) > PREFETCH_MAX_SUBDIRS:
+        return
+    try:
+        mtime_ns = os.stat(image_path).st_mtime_ns
+    except OSError:
+        return
+    keys = [
+        (image_path, offset, os.path.join(current_path, name).replace("\\", "/"), mtime_ns)
+        for name in subdirs
+    ]
+    with _QUEUED_LISTINGS_LOCK:
+        # Keys for an earlier version of this image will never be asked for again
+        _QUEUED_LISTINGS.difference_update(
+            [key for key in _QUEUED_LISTINGS if key[0] == image_path and key[3] != mtime_ns]
+        )
+        fresh = [key for key in keys if key not in _QUEUED_LISTINGS]
+        _QUEUED_LISTINGS.update(fresh)
+    for key in fresh:
+        _LISTING_PREFETCH.submit(_prefetch_listing, *key)
+
+def _warm_filesystem(image_path, offset, mtime_ns):
+    """Open one partition's filesystem into the cache; partitions without one are skipped"""
+    try:
+        open_filesystem(image_path, offset, mtime_ns)
+    except Exception:
+        pass
+
+def prewarm_filesystems(image_path, partitions):
+    """Open every scanned partition's filesystem in the background"""
+    if len(partitions) > PREWARM_MAX_PARTITIONS:
+        return
+    try:
+        mtime_ns = os.stat(image_path).st_mtime_ns
+    except OSError:
+        return
+    for p in partitions:
+        _LISTING_PREFETCH.submit(_warm_filesystem, image_path, p['Offset_Bytes'], mtime_ns)
+
+def list_directory_contents(image_path, offset, path="/"):
+    """List contents of a directory using pytsk3"""
+    try:
+        mtime_ns = os.stat(image_path).st_mtime_ns
+        return _read_directory(image_path, offset, path, mtime_ns)
     except Exception as e:
         st.error(f"Error listing directory: {str(e)}")
-        
-    return pd.DataFrame(results)
+        return pd.DataFrame()
+
+PARTITION_SCHEMA = pa.schema([
+    ("Index", pa.int32()),
+    ("Start", pa.int64()),
+    ("Length", pa.int64()),
+    ("Description", pa.string()),
+    ("Size (MB)", pa.float64()),
+])
+
+# Rows per Arrow record batch when streaming partitions into a table
+PARTITION_BATCH_ROWS = 256
+
+def _partition_batch(addrs, starts, lens, descs):
+    """Build one Arrow record batch from column lists"""
+    lengths = pa.array(lens, pa.int64())
+    return pa.record_batch([
+        pa.array(addrs, pa.int32()),
+        pa.array(starts, pa.int64()),
+        lengths,
+        pa.array(descs, pa.string()),
+        pc.multiply(lengths.cast(pa.float64()), 512 / 1048576),
+    ], schema=PARTITION_SCHEMA)
+
+def iter_partition_batches(partitions):
+    """Yield partitions as Arrow record batches of PARTITION_BATCH_ROWS rows"""
+    addrs, starts, lens, descs = [], [], [], []
+    for p in partitions:
+        addrs.append(p['Address'])
+        starts.append(p['Start'])
+        lens.append(p['Length'])
+        descs.append(p['Description'])
+        if len(addrs) == PARTITION_BATCH_ROWS:
+            yield _partition_batch(addrs, starts, lens, descs)
+            addrs, starts, lens, descs = [], [], [], []
+    if addrs:
+        yield _partition_batch(addrs, starts, lens, descs)
+
+def build_partition_table(partitions):
+    """Build a PyArrow table of partitions that st.dataframe renders directly"""
+    return pa.Table.from_batches(iter_partition_batches(partitions), schema=PARTITION_SCHEMA)
 
-def extract_file(image_path, offset, path, output_path):
-    """Extract a specific file"""
+def extract_file(image_path, offset, path, output_path, block_size=EXTRACT_BLOCK):
+    """Extract a specific file, copying it block by block from the cached filesystem handle"""
     try:
-        img_info = pytsk3.Img_Info(image_path)
-        fs_info = pytsk3.FS_Info(img_info, offset=offset)
+        _, fs_info = open_filesystem(image_path, offset, os.stat(image_path).st_mtime_ns)
         file_entry = fs_info.open(path)
+        size = file_entry.info.meta.size
         
         with open(output_path, "wb") as outfile:
-
-            # Copy file data
-            # Reading in chunks 
-            offset_read = 0
-            size = file_entry.info.meta.size
-            BUFF_SIZE = 1024 * 1024
+            # Reserve the output extents up front so large files aren't fragmented
+            if size and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(outfile.fileno(), 0, size)
+                except OSError:
+                    pass
             
-            while offset_read < size:
-                available_to_read = min(BUFF_SIZE, size - offset_read)
-                data = file_entry.read_random(offset_read, available_to_read)
+            # pytsk3 holds the GIL inside read_random, so reads stay sequential
+            written = 0
+            while written < size:
+                data = file_entry.read_random(written, min(block_size, size - written))
                 if not data: break
                 outfile.write(data)
-                offset_read += len(data)
+                written += len(data)
+            
+            # Trim any space preallocated past a short read
+            outfile.truncate(written)
                 
         return True, "Extraction successful"
     except Exception as e:
@@ -119,6 +409,10 @@ def render_file_parser(case_id, image_info=None):
         else:
             demo_mode = False
     
+    # Warm the partition table while the user is still looking at this page
+    if HAS_PYTSK3 and not is_json_profile and file_path and os.path.isfile(file_path):
+        prefetch_image(file_path)
+    
     if is_json_profile:
         render_json_profile_parsing(case_id, image_info)
     elif demo_mode:
@@ -175,23 +469,18 @@ def render_json_profile_parsing(case_id, image_info):
 
 def render_demo_mode():
     st.subheader("📂 Detected Partitions (Demo)")   
+    st.caption("Select a partition to browse it")
     
-    partitions = [
-        {"name": "boot", "type": "ext4", "size": "32 MB", "files": 150},
-        {"name": "system", "type": "ext4", "size": "2.8 GB", "files": 4521},
-        {"name": "userdata", "type": "ext4", "size": "12.5 GB", "files": 8934},
-        {"name": "cache", "type": "ext4", "size": "512 MB", "files": 342},
-    ]
-    
-    for partition in partitions:
-        with st.expander(f"📁 Partition: {partition['name']} ({partition['type']}) - {partition['size']}"):
-            col1, col2, col3 = st.columns(3)
-            col1.metric("Type", partition['type'])
-            col2.metric("Size", partition['size'])
-            col3.metric("Files", partition['files'])
-            
-            if st.button(f"Browse {partition['name']}", key=f"browse_{partition['name']}"):
-                st.session_state['selected_partition'] = partition['name']
+    event = st.dataframe(
+        _DEMO_PARTITIONS_DF,
+        use_container_width=True,
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="demo_partitions"
+    )
+    if event.selection.rows:
+        st.session_state['selected_partition'] = _DEMO_PARTITIONS[event.selection.rows[0]]['name']
     
     st.divider()
     
@@ -200,15 +489,21 @@ def render_demo_mode():
         st.subheader(f"📂 Browsing: /{partition_name}")
         
         key_directories = get_key_directories(partition_name)
+        if not key_directories:
+            return
         
-        for directory in key_directories:
-            with st.expander(f"📁 {directory['path']}"):
-                st.write(f"**Description:** {directory['description']}")
-                st.write(f"**Files:** {directory['file_count']}")
-                st.write(f"**Forensic Value:** {directory['value']}")
-                
-                if st.button(f"Extract Data", key=f"extract_{directory['path']}"):
-                    st.success(f"✅ Marked for extraction: {directory['path']}")
+        dir_event = st.dataframe(
+            _KEY_DIRS_DF[partition_name],
+            use_container_width=True,
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key=f"demo_dirs_{partition_name}"
+        )
+        if dir_event.selection.rows:
+            directory = key_directories[dir_event.selection.rows[0]]
+            if st.button(f"Extract Data", key=directory['extract_key']):
+                st.success(f"✅ Marked for extraction: {directory['path']}")
 
 def render_real_parsing(case_id, image_info):
     if not HAS_PYTSK3:
@@ -231,22 +526,27 @@ def render_real_parsing(case_id, image_info):
     # Partition Table Analysis
     if st.button("🔍 Scan for Partitions", type="primary"):
         with st.spinner("Scanning partition table..."):
+            # Re-scanning drops filesystem handles opened against the old layout
+            open_filesystem.cache_clear()
             try:
-                img_info = pytsk3.Img_Info(image_path)
-                volume_info = pytsk3.Volume_Info(img_info)
+                # Each scan consumes the warm-up so the next one reads the table again
+                warmed = take_prefetched(image_path)
+                
+                if warmed:
+                    size_bytes, partitions = warmed
+                else:
+                    prime_image_cache(image_path)
+                    img_info = pytsk3.Img_Info(image_path)
+                    # Read the size once while the image is open; the partition
+                    # view reuses it instead of reopening the image
+                    size_bytes = img_info.get_size()
+                    partitions = scan_partitions(img_info)
                 
-                partitions = []
-                for p in volume_info:
-                    if p.flags == pytsk3.TSK_VS_PART_FLAG_ALLOC:
-                        partitions.append({
-                            "Address": p.addr,
-                            "Start": p.start,
-                            "Length": p.len,
-                            "Description": p.desc.decode('utf-8'),
-                            "Offset_Bytes": p.start * 512
-                        })
+                st.session_state['image_size_bytes'] = size_bytes
                 st.session_state['partitions_found'] = partitions
                 st.session_state['show_decryption'] = False
+                # Each partition's first browse would pay an FS_Info open; do them now
+                prewarm_filesystems(image_path, partitions)
                 st.success(f"Found {len(partitions)} partitions")
             except Exception as e:
                 st.session_state['show_decryption'] = True
@@ -278,9 +578,11 @@ def render_real_parsing(case_id, image_info):
                     # Simulation of decryption process
                     import time
                     progress_bar = st.progress(0)
+                    # Redraw at ~10 Hz rather than on every step
                     for i in range(100):
                         time.sleep(0.01)
-                        progress_bar.progress(i + 1)
+                        if (i + 1) % 10 == 0:
+                            progress_bar.progress(i + 1)
                     
                     # Since we don't have actual decryption binaries:
                     if str(case_id).lower() in ["democase", "demo-case"]:
@@ -293,6 +595,10 @@ def render_real_parsing(case_id, image_info):
 
     if 'partitions_found' in st.session_state:
         st.write("### Select Partition to Browse")
+        size_bytes = st.session_state.get('image_size_bytes')
+        if size_bytes:
+            st.write(f"**Image Size:** {size_bytes * BYTES_TO_GB:.2f} GB")
+        st.dataframe(build_partition_table(st.session_state['partitions_found']), use_container_width=True, hide_index=True)
         
         # Create a selection list
         opts = {f"{p['Description']} (Start: {p['Start']})": p['Offset_Bytes'] for p in st.session_state['partitions_found']}
@@ -322,12 +628,22 @@ def render_real_parsing(case_id, image_info):
                      st.session_state['fs_current_path'] = os.path.dirname(current_path.rstrip("/"))
                      if st.session_state['fs_current_path'] == "": st.session_state['fs_current_path'] = "/"
                      st.rerun()
+        with col_nav2:
+            if st.button("🔄 Refresh"):
+                _read_directory.clear()
+                # Let the next listing warm its subdirectories again
+                with _QUEUED_LISTINGS_LOCK:
+                    _QUEUED_LISTINGS.clear()
+                st.rerun()
 
         # List files
         with st.spinner(f"Listing {current_path}..."):
             df_files = list_directory_contents(image_path, st.session_state['fs_offset'], current_path)
         
         if not df_files.empty:
+            # Warm the likely next clicks while the user reads this listing
+            prefetch_subdirectories(image_path, st.session_state['fs_offset'], current_path, df_files)
+            
             # Display as interactive table? 
             # We want buttons. Dataframe with selection is okay, but explicit buttons are better for actions.
             
@@ -344,18 +660,20 @@ def render_real_parsing(case_id, image_info):
             
             # Action selector
             st.write("### Actions")
-            selected_file_name = st.selectbox("Select File/Folder", df_display['Name'].tolist())
-            
-            selected_row = df_display[df_display['Name'] == selected_file_name].iloc[0]
+            # Name -> Type map built once, so the selection lookup is a dict hit
+            # rather than a boolean-mask scan of the whole listing
+            type_by_name = dict(zip(df_display['Name'], df_display['Type']))
+            selected_file_name = st.selectbox("Select File/Folder", list(type_by_name))
+            selected_type = type_by_name.get(selected_file_name)
             
             col_act1, col_act2 = st.columns(2)
             with col_act1:
-                if selected_row['Type'] == 'DIR':
+                if selected_type == 'DIR':
                     if st.button(f"Open Folder: {selected_file_name}"):
                         new_path = os.path.join(current_path, selected_file_name).replace("\\", "/")
                         st.session_state['fs_current_path'] = new_path
                         st.rerun()
-                else:
+                elif selected_type is not None:
                     if st.button(f"Extract File: {selected_file_name}"):
                         # Create extraction dir
                         extract_dir = os.path.join(os.getcwd(), "extracted_evidence", case_id)
@@ -384,53 +702,4 @@ def render_real_parsing(case_id, image_info):
 
 def get_key_directories(partition):
     """Get forensically important directories based on partition type (Demo)"""
-    if partition == "userdata":
-        return [
-            {
-                "path": "/data/data/com.whatsapp/databases",
-                "description": "WhatsApp chat databases",
-                "file_count": 45,
-                "value": "High"
-            },
-            {
-                "path": "/data/data/com.android.providers.contacts/databases",
-                "description": "Contacts database",
-                "file_count": 12,
-                "value": "High"
-            },
-            {
-                "path": "/data/data/com.android.providers.telephony/databases",
-                "description": "SMS and call logs",
-                "file_count": 8,
-                "value": "Critical"
-            },
-            {
-                "path": "/data/media/DCIM",
-                "description": "Camera photos and videos",
-                "file_count": 532,
-                "value": "Medium"
-            },
-            {
-                "path": "/data/data/com.android.chrome/app_chrome/Default",
-                "description": "Chrome browser history and cache",
-                "file_count": 234,
-                "value": "Medium"
-            },
-            {
-                "path": "/data/system/users/0",
-                "description": "User account information",
-                "file_count": 23,
-                "value": "High"
-            }
-        ]
-    elif partition == "system":
-        return [
-            {
-                "path": "/system/build.prop",
-                "description": "System build properties",
-                "file_count": 1,
-                "value": "Low"
-            }
-        ]
-    else:
-        return []
+    return _KEY_DIRS.get(partition, [])
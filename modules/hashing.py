@@ -0,0 +1,218 @@
+"""
+Hashing Module
+Single-pass multi-digest hashing of evidence files. Kept free of Streamlit
+and the database so the background hash process can import it on its own:
+
+    python -m modules.hashing <path> <algorithm>...
+
+prints "progress <bytes>" lines, then "result <json digests>" or "error <message>".
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+
+# Chunk size for processing large files (8MB chunks)
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Files above this size are hashed with read() rather than mapped
+MMAP_MAX_BYTES = 1 << 40
+
+# Minimum seconds between progress bar redraws during long operations
+PROGRESS_INTERVAL = 0.1
+
+# Named constructors for the common digests skip hashlib.new()'s lookup by name
+HASH_CONSTRUCTORS = {'sha256': hashlib.sha256, 'md5': hashlib.md5}
+
+def fadvise(file_obj, advice):
+    """Best-effort posix_fadvise over a whole file; skipped for in-memory uploads and on Windows"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(file_obj.fileno(), 0, 0, getattr(os, advice))
+    except (AttributeError, OSError, ValueError):
+        pass
+
+def _hash_view_parallel(view, hash_objs, progress=None):
+    """
+    Run each hasher over the whole view on its own thread. OpenSSL releases
+    the GIL for every large update, so SHA-256 and MD5 proceed on separate
+    cores. Progress is reported from this (the script) thread, since
+    Streamlit elements can't be updated from worker threads.
+    """
+    size = len(view)
+    done = [0] * len(hash_objs)
+    
+    def worker(index, hash_obj):
+        for offset in range(0, size, CHUNK_SIZE):
+            hash_obj.update(view[offset:offset + CHUNK_SIZE])
+            done[index] = min(offset + CHUNK_SIZE, size)
+    
+    with ThreadPoolExecutor(max_workers=len(hash_objs)) as pool:
+        futures = [pool.submit(worker, i, hash_obj) for i, hash_obj in enumerate(hash_objs)]
+        while True:
+            finished, _ = wait(futures, timeout=PROGRESS_INTERVAL)
+            if progress:
+                progress(min(done))
+            if len(finished) == len(futures):
+                break
+        for future in futures:
+            future.result()
+
+def _hash_mapped(file_obj, hash_objs, progress=None):
+    """
+    Hash an on-disk file through mmap, feeding memoryview slices to each hasher
+    without copying them into Python bytes. Returns False if the file can't be mapped.
+    """
+    try:
+        fileno = file_obj.fileno()
+        size = os.fstat(fileno).st_size
+    except (AttributeError, OSError, ValueError):
+        return False
+    if size == 0 or size > MMAP_MAX_BYTES:
+        return False
+    
+    try:
+        mapped = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return False
+    
+    can_advise = hasattr(mapped, 'madvise')
+    with mapped:
+        if can_advise:
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        view = memoryview(mapped)
+        if len(hash_objs) > 1:
+            _hash_view_parallel(view, hash_objs, progress)
+            # Hashers run at different speeds, so pages are dropped once at the end
+            if can_advise:
+                mapped.madvise(mmap.MADV_DONTNEED)
+        else:
+            for offset in range(0, size, CHUNK_SIZE):
+                chunk = view[offset:offset + CHUNK_SIZE]
+                for hash_obj in hash_objs:
+                    hash_obj.update(chunk)
+                chunk.release()
+                if progress:
+                    progress(offset + min(CHUNK_SIZE, size - offset))
+                # Drop hashed pages so resident memory stays at one chunk
+                if can_advise:
+                    mapped.madvise(mmap.MADV_DONTNEED, offset, min(CHUNK_SIZE, size - offset))
+        view.release()
+    return True
+
+def _hash_in_memory(file_obj, hash_objs, progress=None):
+    """
+    Hash an in-memory upload (BytesIO) straight from its buffer through
+    memoryview slices, with no reads or copies. hashlib releases the GIL for
+    each large update. Returns False if the object has no buffer to expose.
+    """
+    getbuffer = getattr(file_obj, 'getbuffer', None)
+    if getbuffer is None:
+        return False
+    
+    with getbuffer() as view:
+        if len(hash_objs) > 1:
+            _hash_view_parallel(view, hash_objs, progress)
+            return True
+        size = len(view)
+        for offset in range(0, size, CHUNK_SIZE):
+            chunk = view[offset:offset + CHUNK_SIZE]
+            for hash_obj in hash_objs:
+                hash_obj.update(chunk)
+            chunk.release()
+            if progress:
+                progress(min(offset + CHUNK_SIZE, size))
+    return True
+
+def new_hasher(algorithm):
+    """
+    Hash object for `algorithm`. BLAKE3 comes from the optional blake3 package
+    and hashes large updates across all cores; everything else is hashlib.
+    """
+    if algorithm == 'blake3':
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    constructor = HASH_CONSTRUCTORS.get(algorithm)
+    return constructor() if constructor else hashlib.new(algorithm)
+
+def calculate_hashes_chunked(uploaded_file, algorithms=('sha256', 'md5'), progress=None):
+    """
+    Calculate several hashes of file content in a single chunked pass.
+    Each chunk is read once and fed to every hasher; `progress`, if given,
+    is called with the number of bytes hashed so far.
+    Returns a dict of algorithm -> hex digest.
+    """
+    hash_objs = [new_hasher(algorithm) for algorithm in algorithms]
+    
+    # On-disk files are mapped and uploads hashed from their buffer, neither of
+    # which touches the file position; anything else falls back to reads
+    if not (_hash_mapped(uploaded_file, hash_objs, progress)
+            or _hash_in_memory(uploaded_file, hash_objs, progress)):
+        try:
+            uploaded_file.seek(0)
+        except Exception:
+            pass
+        
+        # Linear scan: let the kernel widen readahead for this file
+        fadvise(uploaded_file, 'POSIX_FADV_SEQUENTIAL')
+        
+        # Read into one preallocated buffer and hash through a memoryview,
+        # so no new bytes object is allocated per chunk
+        buffer = bytearray(CHUNK_SIZE)
+        view = memoryview(buffer)
+        bytes_read = 0
+        while True:
+            n = uploaded_file.readinto(buffer)
+            if not n:
+                break
+            chunk = view[:n]
+            for hash_obj in hash_objs:
+                hash_obj.update(chunk)
+            bytes_read += n
+            if progress:
+                progress(bytes_read)
+        
+        # The hashed pages won't be reused; don't let a multi-GB image evict the page cache
+        fadvise(uploaded_file, 'POSIX_FADV_DONTNEED')
+        
+        # Reset file pointer for potential reuse
+        try:
+            uploaded_file.seek(0)
+        except Exception:
+            pass
+    
+    return {algorithm: hash_obj.hexdigest() for algorithm, hash_obj in zip(algorithms, hash_objs)}
+
+def main(argv):
+    """Hash one file for HashWorker, reporting progress and the digests on stdout"""
+    path, algorithms = argv[0], tuple(argv[1:])
+    last_tick = 0.0
+    
+    def progress(bytes_done):
+        nonlocal last_tick
+        now = time.monotonic()
+        if now - last_tick >= PROGRESS_INTERVAL:
+            last_tick = now
+            print(f"progress {bytes_done}", flush=True)
+    
+    try:
+        with open(path, 'rb') as f:
+            hashes = calculate_hashes_chunked(f, algorithms, progress=progress)
+    except Exception as e:
+        print(f"error {' '.join(str(e).split())}", flush=True)
+        return 1
+    print(f"result {json.dumps(hashes)}", flush=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -8,61 +8,145 @@ import hashlib
 from pathlib import Path
 import tempfile
 import os
+import time
 import subprocess
 import shutil
+import tarfile
 from datetime import datetime
 import json
+import re
+import sys
+import threading
 from database.db_manager import get_case
+from modules.hashing import CHUNK_SIZE, PROGRESS_INTERVAL, HAS_BLAKE3, fadvise, calculate_hashes_chunked
 
-# Chunk size for processing large files (8MB chunks)
-CHUNK_SIZE = 8 * 1024 * 1024
+try:
+    import ssl
+    OPENSSL_VERSION = ssl.OPENSSL_VERSION
+except ImportError:
+    OPENSSL_VERSION = "an unknown OpenSSL"
 
+# Repository root: working directory for `python -m modules.hashing`
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Buffer size for streaming device acquisitions to disk
+COPY_BUFFER_SIZE = 16 * 1024 * 1024
+
+# Every text signature looked for in the image header, matched in one scan
+HEADER_SIGNATURES = re.compile(rb"Android|ANDROID|Apple|iOS|HFS|ext4|EXT4|ext3|EXT3")
+
+# Boot-sector jump instructions (first 3 bytes) that identify FAT-family volumes
+BOOT_SECTOR_TYPES = {
+    b'\xEB\x52\x90': 'FAT32 (Suspected)',
+    b'\xEB\x76\x90': 'FAT32 (Suspected)',
+    b'\xEB\x58\x90': 'exFAT (Suspected)',
+}
+
+# Seconds between polls of a background hash job
+HASH_POLL_INTERVAL = 0.5
+
+# Child processes aren't available in the browser (Pyodide) build
+IS_WASM = sys.platform == "emscripten"
+
+# hashlib only reaches OpenSSL's SHA-NI / ARMv8 SHA code paths when Python is
+# linked against OpenSSL; otherwise it falls back to the slow builtin SHA-256
+HAS_OPENSSL_SHA256 = hashlib.sha256.__module__ == '_hashlib'
+
+# SHA-256 throughput below this (MB/s) means the OpenSSL build lacks SHA-NI / AVX2 code
+SHA256_SLOW_MBPS = 500
+
+@st.cache_data(ttl=60, show_spinner=False)
 def check_adb_available():
     """Check if ADB is available in system PATH"""
     return shutil.which("adb") is not None
 
-def get_connected_devices():
-    """Get list of connected Android devices via ADB"""
-    devices = []
+@st.cache_data(ttl=5, show_spinner=False)
+def list_adb_devices():
+    """
+    Devices reported by `adb devices -l`, cached for a few seconds so widget
+    reruns don't start a new adb process each time. "Scan for Devices" clears it.
+    """
+    from modules.adb_forensics import get_connected_devices
+    return get_connected_devices()
+
+# A complete tar ends with two zero-filled 512-byte blocks
+TAR_END_MARKER = 1024
+
+def verify_tar_archive(path):
+    """
+    Walk a tar archive's headers to its end-of-archive marker and check that only
+    zero padding follows. Raises RuntimeError if the archive is truncated or has
+    stray bytes (e.g. device-side error text) spliced into it.
+    """
     try:
-        result = subprocess.run(["adb", "devices", "-l"], capture_output=True, text=True)
-        lines = result.stdout.splitlines()
-        for line in lines[1:]:
-            if line.strip() and "device" in line:
-                parts = line.split()
-                serial = parts[0]
-                model = "Unknown"
-                for part in parts:
-                    if part.startswith("model:"):
-                        model = part.split(":")[1]
-                devices.append({"serial": serial, "model": model, "details": line})
-    except Exception:
-        pass
-    return devices
+        with tarfile.open(path, mode='r:') as archive:
+            for _ in archive:
+                pass
+            end = archive.offset
+    except tarfile.TarError as e:
+        raise RuntimeError(f"Acquired archive is not a valid tar: {e}")
+    
+    # tarfile treats EOF at a header boundary as a normal end, so a stream cut
+    # between members only shows up as a missing end-of-archive marker
+    if os.path.getsize(path) - end < TAR_END_MARKER:
+        raise RuntimeError(f"Acquired archive is truncated: no end-of-archive marker after offset {end}")
+    
+    with open(path, 'rb') as f:
+        f.seek(end)
+        while True:
+            block = f.read(COPY_BUFFER_SIZE)
+            if not block:
+                break
+            if block.strip(b'\0'):
+                raise RuntimeError(f"Acquired archive is corrupt: unexpected data after offset {end}")
 
 def acquire_logical_image(device_serial, case_id):
-    """Acquire logical data (sdcard) from device and zip it"""
+    """
+    Acquire logical data (sdcard) from device as a tar archive.
+    The archive is streamed from the device, written and hashed as it arrives,
+    so nothing is staged in a temp directory, then checked with tarfile before
+    it is accepted. Returns (path, filename, sha256), or (None, error message, None).
+    """
+    dest_tar = None
     try:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        target_dir = tempfile.mkdtemp()
-        dest_zip = os.path.join(tempfile.gettempdir(), f"logical_dump_{device_serial}_{timestamp}.zip")
+        dest_tar = os.path.join(tempfile.gettempdir(), f"logical_dump_{device_serial}_{timestamp}.tar")
         
         # Simple logical acquisition of /sdcard/Download as a demo/safe path 
         # In real forensics, we'd aim for more, but /sdcard is good for logical
         # Limited to Download to avoid massive dumps in this demo
-        cmd = ["adb", "-s", device_serial, "pull", "/sdcard/Download", target_dir]
+        # `shell -T` (shell protocol, no pty) keeps tar's stderr out of the archive
+        # and reports tar's exit status; `exec-out` merges the two and always exits 0
+        cmd = ["adb", "-s", device_serial, "shell", "-T", "tar", "-cf", "-", "-C", "/sdcard/Download", "."]
         
-        subprocess.run(cmd, check=True)
-        
-        # Zip the directory
-        shutil.make_archive(dest_zip.replace('.zip', ''), 'zip', target_dir)
+        hash_obj = hashlib.sha256()
+        buffer = bytearray(COPY_BUFFER_SIZE)
+        view = memoryview(buffer)
+        # stderr goes to a file so tar's warnings can't fill the pipe and stall the copy
+        with tempfile.TemporaryFile() as err, open(dest_tar, "wb") as out:
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err) as proc:
+                while True:
+                    n = proc.stdout.readinto(buffer)
+                    if not n:
+                        break
+                    chunk = view[:n]
+                    out.write(chunk)
+                    hash_obj.update(chunk)
+            drop_written_pages(out)
+            
+            if proc.returncode != 0:
+                err.seek(0)
+                message = err.read().decode(errors="replace").strip()
+                raise RuntimeError(message or f"adb exited with code {proc.returncode}")
         
-        # Cleanup temp dir
-        shutil.rmtree(target_dir, ignore_errors=True)
+        # Devices without the shell protocol still merge stderr into stdout
+        verify_tar_archive(dest_tar)
         
-        return dest_zip, f"logical_dump_{timestamp}.zip"
+        return dest_tar, f"logical_dump_{timestamp}.tar", hash_obj.hexdigest()
     except Exception as e:
-        return None, str(e)
+        if dest_tar and os.path.exists(dest_tar):
+            os.remove(dest_tar)
+        return None, str(e), None
 
 def render_direct_connection(case_id):
     """Render interface for direct device connection"""
@@ -436,9 +520,8 @@ def render_direct_connection(case_id):
                 with open(dest_path, "w", encoding="utf-8") as f:
                     json.dump(profile_data, f, indent=4)
                     
-                # Calculate Hash
-                uploaded_profile.seek(0)
-                sha256_hash = hashlib.sha256(uploaded_profile.read()).hexdigest()
+                # Calculate Hash (streamed, without a full-size copy of the upload)
+                sha256_hash = calculate_hash_chunked(uploaded_profile, 'sha256')
                 
                 # Update case & evidence
                 from database.db_manager import update_case, add_chain_of_custody, add_evidence
@@ -484,10 +567,11 @@ def render_direct_connection(case_id):
             return
             
         if st.button("🔄 Scan for Devices"):
+            list_adb_devices.clear()
             st.rerun()
             
-        from modules.adb_forensics import get_connected_devices, run_full_logical_extraction
-        devices = get_connected_devices()
+        from modules.adb_forensics import run_full_logical_extraction
+        devices = list_adb_devices()
         
         if not devices:
             st.warning("No devices detected. Please check your connection and USB Debugging settings.")
@@ -514,7 +598,7 @@ def render_direct_connection(case_id):
                 return
                 
             st.write("### Acquisition Options")
-            acq_type = st.radio("Acquisition Type", ["Forensic Profile (Metadata, Packages, Processes, Logs)", "Logical Dump (Zip /sdcard/Download)"])
+            acq_type = st.radio("Acquisition Type", ["Forensic Profile (Metadata, Packages, Processes, Logs)", "Logical Dump (Tar /sdcard/Download)"])
             
             if acq_type == "Forensic Profile (Metadata, Packages, Processes, Logs)":
                 st.info("Extracts comprehensive system configurations, installed applications, active processes, and logs.")
@@ -565,23 +649,18 @@ def render_direct_connection(case_id):
                         else:
                             st.error(f"Acquisition failed: {profile_data}")
             else:
-                # Zip /sdcard/Download
-                st.write("Extracts contents from `/sdcard/Download` folder as a logical container (ZIP).")
+                # Tar of /sdcard/Download
+                st.write("Extracts contents from `/sdcard/Download` folder as a logical container (TAR).")
                 if st.button("🚀 Start Acquisition"):
                     with st.spinner("Acquiring data from device... Do not disconnect!"):
-                        file_path, name_or_error = acquire_logical_image(selected_device['serial'], case_id)
+                        # The archive is hashed while it is written
+                        file_path, name_or_error, sha256_hash = acquire_logical_image(selected_device['serial'], case_id)
                         
                         if file_path:
                             st.success("✅ Acquisition completed successfully!")
                             st.write(f"**Saved to:** {file_path}")
                             
                             try:
-                                # Hashing
-                                hash_progress = st.progress(0, text="Calculating Hash...")
-                                with open(file_path, "rb") as f:
-                                    sha256_hash = calculate_hash_chunked(f, 'sha256')
-                                hash_progress.progress(100, text="Done")
-                                
                                 metadata = {
                                     "Source": "Direct Connection",
                                     "Device Model": selected_device['model'],
@@ -622,35 +701,166 @@ def render_direct_connection(case_id):
                         else:
                             st.error(f"Acquisition failed: {name_or_error}")
 
-def calculate_hash_chunked(uploaded_file, algorithm='sha256'):
+def drop_written_pages(file_obj):
     """
-    Calculate hash of file content using chunked reading.
-    This prevents memory overflow for large files.
+    Flush a just-written image to disk and drop it from the page cache. Dirty
+    pages can't be evicted, so DONTNEED only takes effect after the sync.
     """
-    hash_obj = hashlib.new(algorithm)
-    
-    # Reset file pointer to beginning
+    file_obj.flush()
     try:
-        uploaded_file.seek(0)
-    except Exception:
-        pass
+        os.fsync(file_obj.fileno())
+    except (AttributeError, OSError, ValueError):
+        return
+    fadvise(file_obj, 'POSIX_FADV_DONTNEED')
+
+def throttled_progress(progress_bar, total_bytes, text):
+    """Progress callback that redraws the bar at most every PROGRESS_INTERVAL seconds"""
+    last_tick = 0.0
+    
+    def update(bytes_done):
+        nonlocal last_tick
+        now = time.monotonic()
+        if now - last_tick >= PROGRESS_INTERVAL or bytes_done >= total_bytes:
+            last_tick = now
+            percent = min(100, int(bytes_done * 100 / total_bytes)) if total_bytes else 100
+            progress_bar.progress(percent, text=text)
     
-    # Read and hash in chunks
-    bytes_read = 0
-    while True:
-        chunk = uploaded_file.read(CHUNK_SIZE)
-        if not chunk:
-            break
-        hash_obj.update(chunk)
-        bytes_read += len(chunk)
+    return update
+
+@st.cache_resource(show_spinner=False)
+def sha256_throughput():
+    """
+    SHA-256 speed of this interpreter in MB/s, measured once per server over
+    8 MiB of zeros (a few milliseconds on an accelerated build).
+    """
+    data = bytes(8 * 1024 * 1024)
+    hashlib.sha256(data[:4096])  # load the OpenSSL provider before timing
+    start = time.perf_counter()
+    hashlib.sha256(data)
+    elapsed = time.perf_counter() - start
+    return len(data) / (1024 * 1024) / elapsed if elapsed else float('inf')
+
+class HashWorker:
+    """
+    Hashes on-disk images in child processes, so a multi-GB hash runs outside
+    the Streamlit script and reruns stay responsive while it completes.
+    Children run `python -m modules.hashing`, which imports neither Streamlit
+    nor app.py. A reader thread per job collects its progress and digests.
+    Jobs are keyed by the file fingerprint and shared across sessions.
+    Finished digests are kept for the life of the server, so an unchanged
+    file is never hashed twice, whichever session asks for it.
+    """
+    
+    def __init__(self):
+        self._jobs = {}
+        self._results = {}
+        self._lock = threading.Lock()
+    
+    def _start(self, path, algorithms):
+        """Launch the hashing child for `path` and a thread that follows its output"""
+        stderr = tempfile.TemporaryFile()
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'modules.hashing', os.path.abspath(path), *algorithms],
+            cwd=PROJECT_ROOT,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            text=True
+        )
+        job = {'process': process, 'bytes_done': 0, 'outcome': None}
+        threading.Thread(target=self._follow, args=(job, stderr), daemon=True).start()
+        return job
+    
+    def _follow(self, job, stderr):
+        """Read the child's progress and result lines until it exits"""
+        process = job['process']
+        outcome = None
+        with stderr:
+            for line in process.stdout:
+                kind, _, value = line.rstrip('\n').partition(' ')
+                if kind == 'progress':
+                    job['bytes_done'] = int(value)
+                elif kind == 'result':
+                    outcome = json.loads(value)
+                elif kind == 'error':
+                    outcome = value
+            process.wait()
+            if outcome is None:
+                stderr.seek(0)
+                lines = stderr.read().decode(errors="replace").strip().splitlines()
+                outcome = lines[-1] if lines else f"Hash worker exited with code {process.returncode}"
+        with self._lock:
+            job['outcome'] = outcome
+    
+    def status(self, key, path, algorithms):
+        """
+        Start hashing `path` unless a job for `key` already exists.
+        Returns (bytes hashed so far, digests or None while running);
+        raises RuntimeError if the job failed.
+        """
+        with self._lock:
+            if key in self._results:
+                return None, self._results[key]
+            
+            job = self._jobs.get(key)
+            if job is None:
+                job = self._jobs[key] = self._start(path, algorithms)
+            
+            outcome = job['outcome']
+            if outcome is None:
+                return job['bytes_done'], None
+            if isinstance(outcome, str):
+                raise RuntimeError(outcome)
+            del self._jobs[key]
+            self._results[key] = outcome
+            return job['bytes_done'], outcome
     
-    # Reset file pointer for potential reuse
+    def forget(self, key):
+        """Drop a failed job so the next status() call retries it"""
+        with self._lock:
+            self._jobs.pop(key, None)
+
+@st.cache_resource(show_spinner=False)
+def get_hash_worker():
+    """One HashWorker for the whole server"""
+    return HashWorker()
+
+@st.fragment(run_every=HASH_POLL_INTERVAL)
+def render_hash_job_progress(cache_key, path, algorithms, total_bytes, text):
+    """Redraw the progress of a background hash job, and rerun the page once it has finished"""
     try:
-        uploaded_file.seek(0)
-    except Exception:
+        bytes_done, hashes = get_hash_worker().status(cache_key, path, algorithms)
+    except RuntimeError:
+        # The full rerun reports the failure
+        st.rerun()
+    if hashes is not None:
+        st.rerun()
+    percent = min(100, bytes_done * 100 // total_bytes) if total_bytes else 0
+    st.progress(percent, text=text)
+
+def hash_cache_key(file_obj, file_name, algorithms):
+    """
+    Fingerprint used to reuse hashes across Streamlit reruns. On-disk files are
+    identified by path, size and mtime from a single stat; uploads by their
+    file_id. Returns None when the file can't be fingerprinted cheaply.
+    """
+    try:
+        st_info = os.fstat(file_obj.fileno())
+        return (os.path.abspath(file_obj.name), st_info.st_size, st_info.st_mtime_ns, algorithms)
+    except (AttributeError, OSError, ValueError, TypeError):
         pass
     
-    return hash_obj.hexdigest()
+    file_id = getattr(file_obj, 'file_id', None)
+    if file_id:
+        return (file_name, file_id, algorithms)
+    return None
+
+def calculate_hash_chunked(uploaded_file, algorithm='sha256'):
+    """
+    Calculate hash of file content using chunked reading.
+    This prevents memory overflow for large files.
+    """
+    return calculate_hashes_chunked(uploaded_file, (algorithm,))[algorithm]
 
 def save_uploaded_file_to_disk(uploaded_file, dest_path=None):
     """Save Streamlit uploaded_file to disk in chunks. Returns path."""
@@ -666,11 +876,18 @@ def save_uploaded_file_to_disk(uploaded_file, dest_path=None):
         pass
 
     with open(dest_path, "wb") as f:
-        while True:
-            chunk = uploaded_file.read(CHUNK_SIZE)
-            if not chunk:
-                break
-            f.write(chunk)
+        getbuffer = getattr(uploaded_file, 'getbuffer', None)
+        if getbuffer is not None:
+            # In-memory upload: write its buffer directly, no intermediate chunks
+            with getbuffer() as view:
+                f.write(view)
+        else:
+            while True:
+                chunk = uploaded_file.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+        drop_written_pages(f)
 
     # reset uploaded_file pointer (if needed elsewhere)
     try:
@@ -680,13 +897,24 @@ def save_uploaded_file_to_disk(uploaded_file, dest_path=None):
 
     return dest_path
 
+def get_file_size(uploaded_file):
+    """
+    Size of the file in bytes. On-disk files are measured with fstat so the
+    position is left alone; uploads seek to the end and rewind.
+    """
+    try:
+        return os.fstat(uploaded_file.fileno()).st_size
+    except (AttributeError, OSError, ValueError):
+        pass
+    uploaded_file.seek(0, 2)  # Seek to end
+    size_bytes = uploaded_file.tell()
+    uploaded_file.seek(0)  # Reset to beginning
+    return size_bytes
+
 def get_file_size_mb(uploaded_file):
     """Get file size in MB without loading entire file into memory"""
     try:
-        uploaded_file.seek(0, 2)  # Seek to end
-        size_bytes = uploaded_file.tell()
-        uploaded_file.seek(0)  # Reset to beginning
-        return size_bytes / (1024 * 1024)
+        return get_file_size(uploaded_file) / (1024 * 1024)
     except Exception:
         return 0
 
@@ -727,7 +955,12 @@ def render_image_input(case_id):
     case = get_case(case_id)
     if case and case[4]:
         image_path = case[4]
-        if os.path.exists(image_path):
+        # One stat answers both "does it exist" and "how big is it"
+        try:
+            image_stat = os.stat(image_path)
+        except OSError:
+            image_stat = None
+        if image_stat is not None:
             st.success("✅ Image File Uploaded & Verified")
             
             image_hash = case[5] if case[5] else "Not recorded"
@@ -738,11 +971,7 @@ def render_image_input(case_id):
                 st.subheader("Image Information")
                 st.write(f"**Filename:** {filename}")
                 st.write(f"**Path:** {image_path}")
-                try:
-                    size_mb = os.path.getsize(image_path) / (1024 * 1024)
-                    st.write(f"**Size:** {size_mb:.2f} MB")
-                except:
-                    pass
+                st.write(f"**Size:** {image_stat.st_size / (1024 * 1024):.2f} MB")
             
             with col2:
                 st.subheader("Hash Verification")
@@ -786,7 +1015,7 @@ def render_image_input(case_id):
             st.session_state['verified_local_path'] = None
             
     if local_path:
-        if os.path.exists(local_path) and os.path.isfile(local_path):
+        if os.path.isfile(local_path):
             if st.button("Load Local File", key="load_local") or st.session_state.get('verified_local_path') == local_path:
                 try:
                     # Mark as verified
@@ -820,15 +1049,8 @@ def render_image_input(case_id):
             if is_local:
                 file_name = os.path.basename(selected_file.name)
             
-            # Get file size
-            file_size_mb = 0
-            try:
-                if is_local:
-                    file_size_mb = os.path.getsize(selected_file.name) / (1024 * 1024)
-                else:
-                    file_size_mb = get_file_size_mb(selected_file)
-            except:
-                pass
+            # Get file size (fstat on the open handle for local files)
+            file_size_mb = get_file_size_mb(selected_file)
             
             col1, col2 = st.columns(2)
             
@@ -844,17 +1066,69 @@ def render_image_input(case_id):
             with col2:
                 st.subheader("Hash Verification")
                 
-                hash_progress = st.progress(0, text="Calculating SHA-256 hash...")
+                # SHA-256 is the chain-of-custody hash; MD5 is only for matching legacy records
+                include_md5 = st.checkbox("Also compute MD5 (legacy)", value=False)
+                algorithms = ('sha256', 'md5') if include_md5 else ('sha256',)
+                if HAS_BLAKE3:
+                    # Computed alongside SHA-256 in the same pass, as a fast digest for re-verification
+                    algorithms += ('blake3',)
+                hash_label = "Calculating SHA-256 and MD5 hashes..." if include_md5 else "Calculating SHA-256 hash..."
+                
+                hash_progress = st.progress(0, text=hash_label)
                 
                 try:
-                    sha256_hash = calculate_hash_chunked(selected_file, 'sha256')
-                    hash_progress.progress(50, text="Calculating MD5 hash...")
-                    md5_hash = calculate_hash_chunked(selected_file, 'md5')
+                    # Reruns reuse the hashes of a file already hashed in this session
+                    hash_cache = st.session_state.setdefault('hash_cache', {})
+                    cache_key = hash_cache_key(selected_file, file_name, algorithms)
+                    
+                    hashes = hash_cache.get(cache_key) if cache_key else None
+                    if hashes is None and is_local and cache_key and not IS_WASM:
+                        # Local images are hashed in a worker process; this run only
+                        # shows its progress and the page reruns when it completes
+                        worker = get_hash_worker()
+                        try:
+                            bytes_done, hashes = worker.status(cache_key, selected_file.name, algorithms)
+                        except RuntimeError:
+                            worker.forget(cache_key)
+                            raise
+                        if hashes is None:
+                            hash_progress.empty()
+                            render_hash_job_progress(
+                                cache_key,
+                                selected_file.name,
+                                algorithms,
+                                int(file_size_mb * 1024 * 1024),
+                                hash_label
+                            )
+                            selected_file.close()
+                            return None
+                        hash_cache[cache_key] = hashes
+                    if hashes is None:
+                        hash_progress_cb = throttled_progress(
+                            hash_progress,
+                            int(file_size_mb * 1024 * 1024),
+                            hash_label
+                        )
+                        hashes = calculate_hashes_chunked(selected_file, algorithms, progress=hash_progress_cb)
+                        if cache_key:
+                            hash_cache[cache_key] = hashes
+                    sha256_hash = hashes['sha256']
+                    md5_hash = hashes.get('md5')
                     hash_progress.progress(100, text="Hash calculation complete!")
                     
                     st.code(sha256_hash, language="text")
                     st.caption("SHA-256 Hash")
-                    st.text(f"MD5: {md5_hash}")
+                    if hashes.get('blake3'):
+                        st.text(f"BLAKE3: {hashes['blake3']}")
+                    if md5_hash:
+                        st.text(f"MD5: {md5_hash}")
+                    if not HAS_OPENSSL_SHA256:
+                        st.caption("⚠️ Python's hashlib is not OpenSSL-backed; hashing large images will be slow.")
+                    elif sha256_throughput() < SHA256_SLOW_MBPS:
+                        st.caption(
+                            f"⚠️ SHA-256 runs at {sha256_throughput():.0f} MB/s with {OPENSSL_VERSION}; "
+                            "this OpenSSL build may lack SHA-NI / AVX2 acceleration."
+                        )
                     
                 except Exception as e:
                     st.error(f"Error calculating hash: {str(e)}")
@@ -866,7 +1140,13 @@ def render_image_input(case_id):
             st.subheader("Image Metadata")
             
             metadata_progress = st.progress(0, text="Analyzing image structure...")
-            metadata = analyze_image_structure_chunked(selected_file)
+            # Like the hashes, metadata for an unchanged file is kept across reruns
+            metadata_cache = st.session_state.setdefault('metadata_cache', {})
+            metadata = metadata_cache.get(cache_key) if cache_key else None
+            if metadata is None:
+                metadata = analyze_image_structure_chunked(selected_file)
+                if cache_key and 'Error' not in metadata:
+                    metadata_cache[cache_key] = metadata
             metadata_progress.progress(100, text="Analysis complete!")
             
             for key, value in metadata.items():
@@ -933,6 +1213,7 @@ def render_image_input(case_id):
                 'size': file_size_mb,
                 'sha256': sha256_hash,
                 'md5': md5_hash,
+                'blake3': hashes.get('blake3'),
                 'metadata': metadata,
                 'file_path': st.session_state.get('image_path', '')
             }
@@ -947,40 +1228,63 @@ def render_image_input(case_id):
         
     return None
 
+def read_header(file_obj, length):
+    """
+    Read the first `length` bytes. On-disk files use a positional os.pread so
+    the cursor is left alone; uploads fall back to read() and rewind.
+    """
+    if hasattr(os, 'pread'):
+        try:
+            return os.pread(file_obj.fileno(), length, 0)
+        except (AttributeError, OSError, ValueError):
+            pass
+    file_obj.seek(0)
+    header = file_obj.read(length)
+    file_obj.seek(0)
+    return header
+
 def analyze_image_structure_chunked(uploaded_file):
     """Analyze basic structure of the device image without loading entire file"""
+    try:
+        total_bytes = get_file_size(uploaded_file)
+        # Read only first 4KB for header analysis
+        header = read_header(uploaded_file, 4096)
+    except Exception as e:
+        return {'Error': str(e)}
+    
+    return detect_from_header(header, total_bytes)
+
+def detect_from_header(header, total_bytes):
+    """
+    Build the image metadata from its first 4KB and total size. Pure function,
+    so the result can be reused for any file with the same fingerprint.
+    """
     metadata = {}
     
     try:
-        # Get file size
-        uploaded_file.seek(0, 2)
-        total_bytes = uploaded_file.tell()
-        uploaded_file.seek(0)
-        
+        size_mb = total_bytes / 1048576
         metadata['Total Size'] = f"{total_bytes:,} bytes"
-        metadata['Size (MB)'] = f"{total_bytes / (1024*1024):.2f} MB"
-        metadata['Size (GB)'] = f"{total_bytes / (1024*1024*1024):.2f} GB"
+        metadata['Size (MB)'] = f"{size_mb:.2f} MB"
+        metadata['Size (GB)'] = f"{size_mb / 1024:.2f} GB"
         
-        # Read only first 4KB for header analysis
-        header = uploaded_file.read(4096)
-        uploaded_file.seek(0)
+        # Single pass over the header for all text signatures
+        found = set(HEADER_SIGNATURES.findall(header))
         
         # Detect OS
-        if b'Android' in header or b'ANDROID' in header:
+        if found & {b'Android', b'ANDROID'}:
             metadata['Detected OS'] = 'Android'
-        elif b'Apple' in header or b'iOS' in header or b'HFS' in header:
+        elif found & {b'Apple', b'iOS', b'HFS'}:
             metadata['Detected OS'] = 'iOS'
         else:
             metadata['Detected OS'] = 'Unknown'
         
         # Detect file system type
-        if header.startswith(b'\xEB\x52\x90') or header.startswith(b'\xEB\x76\x90'):
-            metadata['File System Type'] = 'FAT32 (Suspected)'
-        elif header.startswith(b'\xEB\x58\x90'):
-            metadata['File System Type'] = 'exFAT (Suspected)'
-        elif b'ext4' in header or b'EXT4' in header:
+        boot_type = BOOT_SECTOR_TYPES.get(header[:3])
+        if boot_type:
+            metadata['File System Type'] = boot_type
+        elif found & {b'ext4', b'EXT4'}:
             metadata['File System Type'] = 'ext4 (Suspected)'
-        elif b'ext3' in header or b'EXT3' in header:
+        elif found & {b'ext3', b'EXT3'}:
             metadata['File System Type'] = 'ext3 (Suspected)'
         else:
             metadata['File System Type'] = 'Unknown / Raw'
@@ -992,12 +1296,7 @@ def analyze_image_structure_chunked(uploaded_file):
     
     # Encryption Detection
     try:
-        uploaded_file.seek(0)
-        # Read first 1MB for broader search if needed, but 4KB is usually enough for headers
-        # Re-read header to be safe
-        header = uploaded_file.read(4096) 
-        uploaded_file.seek(0)
-        
+        # Reuses the 4KB header read above; that is enough for these signatures
         encryption_found = []
         
         # LUKS (Magic bytes "LUKS\xba\xbe" at offset 0)
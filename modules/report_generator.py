@@ -5,15 +5,15 @@ Generate professional forensic analysis reports in PDF format
 
 import streamlit as st
 from fpdf import FPDF
+from fpdf.enums import XPos, YPos
 from datetime import datetime
 import pandas as pd
+from database.db_manager import get_case, get_case_evidence, get_chain_of_custody, add_chain_of_custody
 
 def render_report_generator(case_id):
     """Render the report generation interface"""
     st.header("Forensic Report Generation")
     
-    from database.db_manager import get_case, get_case_evidence, get_chain_of_custody
-    
     case = get_case(case_id)
     
     if not case:
@@ -22,6 +22,14 @@ def render_report_generator(case_id):
     
     st.info("Generate a comprehensive forensic analysis report for this case")
     
+    render_report_form(case_id, case)
+
+@st.fragment
+def render_report_form(case_id, case):
+    """
+    Report form, generation and download. Runs as a fragment, so submitting
+    the form or downloading reruns only this section, not the whole page.
+    """
     with st.form("report_config"):
         st.subheader("Report Configuration")
         
@@ -65,7 +73,7 @@ def render_report_generator(case_id):
         with st.spinner("Generating forensic report..."):
             try:
                 # Store form values in session state or use them directly
-                # Sanitize inputs for FPDF 1.7.2 compatibility
+                # Inputs are sanitized to Latin-1 for the core PDF fonts
                 pdf = generate_forensic_report(
                     case,
                     report_title,
@@ -79,9 +87,8 @@ def render_report_generator(case_id):
                     conclusions
                 )
                 
-                pdf_output = pdf.output(dest='S')
-                if isinstance(pdf_output, str):
-                    pdf_output = pdf_output.encode('latin-1', errors='replace')
+                # fpdf2 builds the document in a bytearray and returns it directly
+                pdf_output = bytes(pdf.output())
                 
                 # Store in session state
                 st.session_state['generated_report_pdf'] = pdf_output
@@ -89,7 +96,6 @@ def render_report_generator(case_id):
                 st.session_state['generated_report_case'] = case_id
                 
                 # Log usage
-                from database.db_manager import add_chain_of_custody
                 add_chain_of_custody(
                     case_id,
                     "Report Generated",
@@ -116,7 +122,7 @@ def render_report_generator(case_id):
         )
 
 def clean_text(text):
-    """Sanitize text for FPDF 1.7.2 (Latin-1 only)"""
+    """Sanitize text for the core PDF fonts (Latin-1 only)"""
     if not text:
         return ""
     # Replace common incompatible characters
@@ -132,6 +138,27 @@ def clean_text(text):
     # Encode to latin-1 with replacement for any other characters
     return text.encode('latin-1', 'replace').decode('latin-1')
 
+# Font for each kind of text in the report
+REPORT_FONTS = {
+    'title': ("Helvetica", "B", 20),
+    'classification': ("Helvetica", "", 12),
+    'heading': ("Helvetica", "B", 14),
+    'body': ("Helvetica", "", 11),
+    'log': ("Helvetica", "", 10),
+    'hash': ("Courier", "", 9),
+    'footer': ("Helvetica", "I", 10),
+}
+
+def use_font(pdf, role):
+    """Select the font for a kind of text from REPORT_FONTS"""
+    pdf.set_font(*REPORT_FONTS[role])
+
+def section_heading(pdf, title, body_role='body'):
+    """Write a section title, then leave the section's body font selected"""
+    use_font(pdf, 'heading')
+    pdf.cell(0, 10, title, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    use_font(pdf, body_role)
+
 def generate_forensic_report(case, title, investigator, agency, report_date, 
                             status, classification, sections, summary, conclusions):
     """Generate a PDF forensic report"""
@@ -153,104 +180,86 @@ def generate_forensic_report(case, title, investigator, agency, report_date,
     image_file = clean_text(case[4] or 'N/A')
     image_hash = clean_text(case[5] or 'N/A')
     
-    pdf.set_font("Arial", "B", 20)
-    pdf.cell(0, 15, "FORENSIC ANALYSIS REPORT", ln=True, align="C")
+    use_font(pdf, 'title')
+    pdf.cell(0, 15, "FORENSIC ANALYSIS REPORT", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
     
-    pdf.set_font("Arial", "", 12)
-    pdf.cell(0, 10, classification.upper(), ln=True, align="C")
+    use_font(pdf, 'classification')
+    pdf.cell(0, 10, classification.upper(), new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
     pdf.ln(10)
     
-    pdf.set_font("Arial", "B", 14)
-    pdf.cell(0, 10, "Case Information", ln=True)
-    pdf.set_font("Arial", "", 11)
+    section_heading(pdf, "Case Information")
     
-    pdf.cell(0, 8, f"Case ID: {case[0]}", ln=True)
-    pdf.cell(0, 8, f"Case Name: {case_name}", ln=True)
-    pdf.cell(0, 8, f"Lead Investigator: {investigator}", ln=True)
-    pdf.cell(0, 8, f"Agency: {agency}", ln=True)
-    pdf.cell(0, 8, f"Report Date: {report_date.strftime('%Y-%m-%d')}", ln=True)
-    pdf.cell(0, 8, f"Case Status: {status}", ln=True)
+    pdf.cell(0, 8, f"Case ID: {case[0]}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.cell(0, 8, f"Case Name: {case_name}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.cell(0, 8, f"Lead Investigator: {investigator}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.cell(0, 8, f"Agency: {agency}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.cell(0, 8, f"Report Date: {report_date.strftime('%Y-%m-%d')}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.cell(0, 8, f"Case Status: {status}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
     pdf.ln(5)
     
     if "Executive Summary" in sections and summary:
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "Executive Summary", ln=True)
-        pdf.set_font("Arial", "", 11)
+        section_heading(pdf, "Executive Summary")
         pdf.multi_cell(0, 6, summary)
         pdf.ln(5)
     
     if "Device Information" in sections:
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "Device Information", ln=True)
-        pdf.set_font("Arial", "", 11)
+        section_heading(pdf, "Device Information")
         
-        pdf.cell(0, 8, f"Device Info: {device_info}", ln=True)
-        pdf.cell(0, 8, f"Image File: {image_file}", ln=True)
-        pdf.cell(0, 8, f"Image Hash (SHA-256):", ln=True)
-        pdf.set_font("Courier", "", 9)
-        pdf.cell(0, 6, f"{image_hash}", ln=True)
-        pdf.set_font("Arial", "", 11)
+        pdf.cell(0, 8, f"Device Info: {device_info}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        pdf.cell(0, 8, f"Image File: {image_file}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        pdf.cell(0, 8, f"Image Hash (SHA-256):", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        use_font(pdf, 'hash')
+        pdf.cell(0, 6, f"{image_hash}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+        use_font(pdf, 'body')
         pdf.ln(5)
     
     if "Evidence Inventory" in sections:
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "Evidence Inventory", ln=True)
-        pdf.set_font("Arial", "", 11)
+        section_heading(pdf, "Evidence Inventory")
         
-        from database.db_manager import get_case_evidence
         evidence = get_case_evidence(case[0])
         
         if evidence:
-            pdf.cell(0, 8, f"Total Evidence Items: {len(evidence)}", ln=True)
+            pdf.cell(0, 8, f"Total Evidence Items: {len(evidence)}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
             pdf.ln(3)
             
-            for item in evidence[:10]:
-                item_desc = clean_text(item[2])
-                item_val = clean_text(item[3])
-                pdf.cell(0, 6, f"- {item_desc}: {item_val}", ln=True)
+            # One multi_cell for all rows instead of a cell per row
+            rows = "\n".join(f"- {item[2] or ''}: {item[3] or ''}" for item in evidence[:10])
+            pdf.multi_cell(0, 6, clean_text(rows), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
             
             if len(evidence) > 10:
-                pdf.cell(0, 6, f"... and {len(evidence) - 10} more items", ln=True)
+                pdf.cell(0, 6, f"... and {len(evidence) - 10} more items", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         else:
-            pdf.cell(0, 8, "No evidence items logged", ln=True)
+            pdf.cell(0, 8, "No evidence items logged", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         
         pdf.ln(5)
     
     if "Hash Verification" in sections:
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "Hash Verification & Integrity", ln=True)
-        pdf.set_font("Arial", "", 11)
+        section_heading(pdf, "Hash Verification & Integrity")
         pdf.multi_cell(0, 6, "All evidence has been hashed using SHA-256 to ensure integrity and maintain chain of custody. Hash values are stored in the case database.")
         pdf.ln(5)
     
     if "Chain of Custody" in sections:
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "Chain of Custody Log", ln=True)
-        pdf.set_font("Arial", "", 10)
+        section_heading(pdf, "Chain of Custody Log", 'log')
         
-        from database.db_manager import get_chain_of_custody
         custody_log = get_chain_of_custody(case[0])
         
         if custody_log:
-            for log in custody_log[:15]:
-                timestamp = datetime.fromisoformat(log[4]).strftime("%Y-%m-%d %H:%M")
-                log_action = clean_text(log[2])
-                log_user = clean_text(log[3])
-                log_notes = clean_text(log[5])
-                pdf.cell(0, 5, f"{timestamp} - {log_action} by {log_user}: {log_notes[:60]}", ln=True)
+            rows = "\n".join(
+                f"{log[6]} - {log[2] or ''} by {log[3] or ''}: {(log[5] or '')[:60]}"
+                for log in custody_log[:15]
+            )
+            pdf.multi_cell(0, 5, clean_text(rows), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         
         pdf.ln(5)
     
     if "Conclusions" in sections and conclusions:
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "Conclusions", ln=True)
-        pdf.set_font("Arial", "", 11)
+        section_heading(pdf, "Conclusions")
         pdf.multi_cell(0, 6, conclusions)
         pdf.ln(5)
     
     pdf.ln(10)
-    pdf.set_font("Arial", "I", 10)
-    pdf.cell(0, 5, "Report generated by CORTEX - Mobile Device Forensics Analyzer", ln=True, align="C")
-    pdf.cell(0, 5, f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True, align="C")
+    use_font(pdf, 'footer')
+    pdf.cell(0, 5, "Report generated by CORTEX - Mobile Device Forensics Analyzer", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
+    pdf.cell(0, 5, f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
     
     return pdf
@@ -4,9 +4,14 @@ Charts, graphs, maps, and timeline visualizations
 """
 
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
 import pandas as pd
+import numpy as np
+
+# plotly is imported inside the functions that draw, so sessions that never
+# open Visualization don't pay for loading it at app start-up.
+
+# Most markers the location map will send to the browser
+MAP_MAX_POINTS = 5000
 
 def render_visualization(case_id):
     """Render visualization interface"""
@@ -26,8 +31,85 @@ def render_visualization(case_id):
     with tabs[3]:
         render_communication_network()
 
+# Aggregations behind the charts. Cached on the column they read, so reruns
+# with unchanged data skip the pandas work and only rebuild the figures.
+
+@st.cache_data(show_spinner=False)
+def count_values(column, top=None):
+    """Frequency of each value in a column, optionally only the `top` most common"""
+    if top:
+        return column.value_counts(sort=False).nlargest(top)
+    return column.value_counts()
+
+@st.cache_data(show_spinner=False)
+def hourly_counts(timestamps):
+    """Number of events per hour of day, as a Hour/Count frame"""
+    hours = pd.to_datetime(timestamps).dt.hour
+    return hours.value_counts(sort=False).sort_index().rename_axis('Hour').reset_index(name='Count')
+
+@st.cache_data(show_spinner=False)
+def daily_event_counts(timestamps, types):
+    """Number of events per day and type, as a Date/Type/Count frame"""
+    events = pd.DataFrame({'Date': pd.to_datetime(timestamps, errors='coerce').dt.floor('D'), 'Type': types})
+    return events.groupby(['Date', 'Type']).size().reset_index(name='Count')
+
+@st.cache_data(show_spinner=False)
+def downsample_locations(locations, max_points=MAP_MAX_POINTS):
+    """Merge points sharing a ~100 m grid cell and source, sampling if still over max_points"""
+    if len(locations) <= max_points:
+        return locations
+    cells = [
+        locations['Latitude'].round(3).rename('lat_cell'),
+        locations['Longitude'].round(3).rename('lon_cell'),
+        locations['Source'].rename('source_cell'),
+    ]
+    merged = {'Latitude': 'mean', 'Longitude': 'mean', 'Accuracy (m)': 'mean'}
+    merged.update({col: 'first' for col in locations.columns if col not in merged})
+    binned = locations.groupby(cells, sort=False).agg(merged).reset_index(drop=True)
+    if len(binned) > max_points:
+        binned = binned.sample(max_points, random_state=0)
+    return binned
+
+def location_map_figure(map_points):
+    """Map figure with one marker trace per source, fed straight from numpy arrays"""
+    import plotly.graph_objects as go
+    
+    accuracy = map_points['Accuracy (m)'].to_numpy(dtype=float)
+    # Same area scaling plotly express uses: the largest marker is 20 px across
+    sizeref = 2.0 * accuracy.max() / 20 ** 2 if len(accuracy) and accuracy.max() > 0 else 1
+    hover_cols = [col for col in ('Timestamp', 'Accuracy (m)', 'Region') if col in map_points]
+    hovertemplate = '<br>'.join(
+        ['Latitude=%{lat}', 'Longitude=%{lon}'] +
+        [f'{col}=%{{customdata[{i}]}}' for i, col in enumerate(hover_cols)]
+    )
+    
+    fig = go.Figure()
+    for source, points in map_points.groupby('Source', sort=False):
+        fig.add_trace(go.Scattermap(
+            lat=points['Latitude'].to_numpy(),
+            lon=points['Longitude'].to_numpy(),
+            mode='markers',
+            name=str(source),
+            marker=dict(size=points['Accuracy (m)'].to_numpy(), sizemode='area', sizeref=sizeref),
+            customdata=points[hover_cols].astype(str).to_numpy(),
+            hovertemplate=hovertemplate + '<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title="Device Location History",
+        height=600,
+        legend_title_text='Source',
+        map_style="open-street-map",
+        map_zoom=1,
+        map_center={"lat": map_points['Latitude'].mean(), "lon": map_points['Longitude'].mean()},
+        margin={"r":0,"t":40,"l":0,"b":0}
+    )
+    return fig
+
 def render_charts():
     """Render various data charts"""
+    import plotly.express as px
+    
     st.subheader("Data Analysis Charts")
     
     if 'call_logs' in st.session_state:
@@ -35,7 +117,7 @@ def render_charts():
         
         call_logs = st.session_state['call_logs']
         
-        call_type_counts = call_logs['Type'].value_counts()
+        call_type_counts = count_values(call_logs['Type'])
         
         fig = px.pie(
             values=call_type_counts.values,
@@ -44,11 +126,10 @@ def render_charts():
         )
         st.plotly_chart(fig, width='stretch')
         
-        call_logs['Hour'] = pd.to_datetime(call_logs['Timestamp']).dt.hour
-        hourly_calls = call_logs.groupby('Hour').size()
+        hourly_calls = hourly_counts(call_logs['Timestamp'])
         
         fig2 = px.bar(
-            hourly_calls.reset_index(name='Count'),
+            hourly_calls,
             x='Hour',
             y='Count',
             labels={'Hour': 'Hour of Day', 'Count': 'Number of Calls'},
@@ -61,7 +142,7 @@ def render_charts():
         
         sms_data = st.session_state['sms_data']
         
-        contact_counts = sms_data['Contact'].value_counts().head(10)
+        contact_counts = count_values(sms_data['Contact'], top=10)
         
         contact_df = contact_counts.reset_index()
         contact_df.columns = ['Contact', 'Message Count']
@@ -79,7 +160,7 @@ def render_charts():
         st.write("**Browser Activity Analysis**")
         
         history = st.session_state['browser_history']
-        top_sites = history['Title'].value_counts().head(10)
+        top_sites = count_values(history['Title'], top=10)
         
         top_sites_df = top_sites.reset_index()
         top_sites_df.columns = ['Website', 'Visit Count']
@@ -99,25 +180,13 @@ def render_location_map():
     
     if 'locations' in st.session_state:
         locations = st.session_state['locations']
+        map_points = downsample_locations(locations)
         
-        fig = px.scatter_mapbox(
-            locations,
-            lat='Latitude',
-            lon='Longitude',
-            color='Source',
-            size='Accuracy (m)',
-            hover_data=['Timestamp', 'Accuracy (m)', 'Region'],
-            title="Device Location History",
-            zoom=1,
-            height=600
-        )
-        
-        fig.update_layout(
-            mapbox_style="open-street-map",
-            margin={"r":0,"t":40,"l":0,"b":0}
-        )
+        fig = location_map_figure(map_points)
         
         st.plotly_chart(fig, width='stretch')
+        if len(map_points) < len(locations):
+            st.caption(f"Map shows {len(map_points):,} merged markers; the table below lists every point.")
         
         st.metric("Total Location Points", len(locations))
         
@@ -134,13 +203,14 @@ def render_location_map():
 
 def render_timeline_view():
     """Render visual timeline"""
+    import plotly.express as px
+    
     st.subheader("Visual Timeline")
     
     if 'timeline' in st.session_state:
         timeline = st.session_state['timeline']
         
-        timeline['Date'] = pd.to_datetime(timeline['Timestamp']).dt.date
-        daily_events = timeline.groupby(['Date', 'Type']).size().reset_index(name='Count')
+        daily_events = daily_event_counts(timeline['Timestamp'], timeline['Type'])
         
         fig = px.line(
             daily_events,
@@ -153,7 +223,7 @@ def render_timeline_view():
         
         st.plotly_chart(fig, width='stretch')
         
-        event_distribution = timeline['Type'].value_counts()
+        event_distribution = count_values(timeline['Type'])
         
         event_df = event_distribution.reset_index()
         event_df.columns = ['Event Type', 'Count']
@@ -171,33 +241,32 @@ def render_timeline_view():
 
 def render_communication_network():
     """Render communication network graph"""
+    import plotly.express as px
+    
     st.subheader("Communication Network")
     
     st.info("Visualize relationships between contacts based on communication frequency")
     
-    contacts_data = []
+    no_counts = pd.Series(dtype='int64')
+    call_counts = no_counts
+    sms_counts = no_counts
     
     if 'call_logs' in st.session_state:
-        call_contacts = st.session_state['call_logs']['Contact'].value_counts()
-        for contact, count in call_contacts.items():
-            contacts_data.append({"Contact": contact, "Calls": count, "SMS": 0})
+        call_counts = count_values(st.session_state['call_logs']['Contact'])
     
     if 'sms_data' in st.session_state:
-        sms_contacts = st.session_state['sms_data']['Contact'].value_counts()
-        for contact, count in sms_contacts.items():
-            found = False
-            for item in contacts_data:
-                if item['Contact'] == contact:
-                    item['SMS'] = count
-                    found = True
-                    break
-            if not found:
-                contacts_data.append({"Contact": contact, "Calls": 0, "SMS": count})
-    
-    if contacts_data:
-        df = pd.DataFrame(contacts_data)
-        df['Total'] = df['Calls'] + df['SMS']
-        df = df.sort_values('Total', ascending=False).head(15)
+        sms_counts = count_values(st.session_state['sms_data']['Contact'])
+    
+    contacts = call_counts.index.union(sms_counts.index)
+    
+    if len(contacts):
+        calls = call_counts.reindex(contacts, fill_value=0).to_numpy(dtype=np.int32)
+        sms = sms_counts.reindex(contacts, fill_value=0).to_numpy(dtype=np.int32)
+        total = calls + sms
+        # Only the 15 busiest contacts are shown, so build the frame from those rows alone
+        top = np.argpartition(-total, min(15, len(total)) - 1)[:15]
+        top = top[np.argsort(-total[top], kind='stable')]
+        df = pd.DataFrame({'Contact': contacts[top], 'Calls': calls[top], 'SMS': sms[top], 'Total': total[top]})
         
         fig = px.scatter(
             df,
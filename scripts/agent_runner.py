@@ -8,6 +8,7 @@ exfiltrate secrets. It runs locally inside the workflow using the
 GITHUB_TOKEN (via the checkout action) to allow committing results.
 """
 import os
+import shlex
 import subprocess
 import sys
 from pathlib import Path
@@ -17,8 +18,9 @@ ROOT = Path(__file__).resolve().parent.parent
 
 
 def run_command(cmd, cwd=ROOT, check=True, capture=False):
-    print(f"> {cmd}")
-    res = subprocess.run(cmd, shell=True, cwd=cwd, text=True, capture_output=capture)
+    # cmd is an argv list; it is run directly, without an intermediate /bin/sh
+    print(f"> {shlex.join(cmd)}")
+    res = subprocess.run(cmd, cwd=cwd, text=True, capture_output=capture)
     if check and res.returncode != 0:
         print(res.stdout)
         print(res.stderr, file=sys.stderr)
@@ -29,9 +31,9 @@ def run_command(cmd, cwd=ROOT, check=True, capture=False):
 def format_code():
     # Try to run black if installed; otherwise skip
     try:
-        run_command("black --version", check=False)
+        run_command(["black", "--version"], check=False)
         print("Running black formatting...")
-        run_command("black .", check=False)
+        run_command(["black", "."], check=False)
     except Exception:
         print("black not available or formatting failed; skipping")
 
@@ -44,18 +46,17 @@ def smoke_check():
         return
 
     print("Running smoke check: import AIModelPerfector.app")
-    run_command(f"python -c \"import importlib.util, sys; sys.path.insert(0, 'AIModelPerfector'); import app\"", check=False)
+    run_command([sys.executable, "-c", "import importlib.util, sys; sys.path.insert(0, 'AIModelPerfector'); import app"], check=False)
 
 
 def stage_changes():
     # Stage any changes for commit
-    run_command("git add -A", check=False)
-    # Check if there is anything to commit
-    status = run_command("git status --porcelain", check=False, capture=True)
-    output = status.stdout.strip() if status.stdout else ""
-    if output:
+    run_command(["git", "add", "-A"], check=False)
+    # Check if there is anything to commit: exits 1 when the index differs from HEAD
+    staged = run_command(["git", "diff", "--cached", "--quiet"], check=False)
+    if staged.returncode != 0:
         print("Changes detected, creating commit...")
-        run_command("git commit -m \"Auto: agent run updates\" || true", check=False)
+        run_command(["git", "commit", "-m", "Auto: agent run updates"], check=False)
     else:
         print("No changes to commit")
 